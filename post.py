@@ -6,8 +6,9 @@ url = 'http://localhost/CrossCountryHandler/handler.php'
 # Define the data to be sent
 data = {'minor': 96}
 
-# Send a POST request
-response = requests.post(url, data=data)
+# Send a POST request over a pooled session, closed when done
+with requests.Session() as session:
+    response = session.post(url, data=data, timeout=5)
 
 # Print the response from the server
 print('Response:', response.text)
\ No newline at end of file